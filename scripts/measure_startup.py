@@ -0,0 +1,96 @@
+"""
+Startup-time measurement harness for the Minesweeper app.
+
+Launches src/main.py in a fresh interpreter several times with
+MINESWEEPER_STARTUP_TIMING set, reads the "[startup] ..." lines the app
+prints, and reports import time, time to first paint and time to interactive.
+
+Usage:
+    python scripts/measure_startup.py            # 5 cold starts
+    python scripts/measure_startup.py --runs 10  # more samples
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Path to the app entry point (this script lives in <repo>/scripts)
+MAIN_PY = Path(__file__).resolve().parent.parent / "src" / "main.py"
+
+# Matches lines like "[startup] first paint: 123.4 ms"
+STARTUP_LINE = re.compile(r"^\[startup\] (?P<stage>[^:]+): (?P<ms>[0-9.]+) ms$")
+
+# Stages printed by main.py, in the order they happen
+STAGES = ["imports", "first paint", "interactive"]
+
+
+def measure_once(timeout: float):
+    """
+    Start the app once and return {stage: ms} for every reported stage,
+    plus "wall clock" (ms from process spawn until the app is interactive).
+    The app is terminated as soon as it reports it is interactive.
+    """
+    env = dict(os.environ, MINESWEEPER_STARTUP_TIMING="1")
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, str(MAIN_PY)],
+        cwd=MAIN_PY.parent,  # Same working directory as "flet run"
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    # Kill the app if it never becomes interactive (e.g. no display available)
+    watchdog = threading.Timer(timeout, proc.kill)
+    watchdog.start()
+    timings = {}
+    try:
+        for line in proc.stdout:
+            match = STARTUP_LINE.match(line.strip())
+            if not match:
+                continue  # Ignore the game's own debug output
+            timings[match.group("stage")] = float(match.group("ms"))
+            if match.group("stage") == "interactive":
+                timings["wall clock"] = (time.perf_counter() - started) * 1000
+                break
+    finally:
+        watchdog.cancel()
+        proc.terminate()
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure Minesweeper startup time")
+    parser.add_argument("--runs", type=int, default=5, help="number of cold starts")
+    parser.add_argument("--timeout", type=float, default=60.0, help="seconds per run")
+    args = parser.parse_args()
+
+    samples = {stage: [] for stage in STAGES + ["wall clock"]}
+    for run in range(1, args.runs + 1):
+        timings = measure_once(args.timeout)
+        if "interactive" not in timings:
+            print(f"run {run}: app did not report 'interactive' - skipped")
+            continue
+        for stage, ms in timings.items():
+            samples.setdefault(stage, []).append(ms)
+        print(f"run {run}: " + ", ".join(f"{s} {ms:.1f} ms" for s, ms in timings.items()))
+
+    print()
+    print(f"{'stage':<14}{'median':>10}{'min':>10}{'max':>10}")
+    for stage, values in samples.items():
+        if not values:
+            continue
+        print(f"{stage:<14}{statistics.median(values):>10.1f}{min(values):>10.1f}{max(values):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
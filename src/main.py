@@ -1,13 +1,39 @@
+import os
+import time
+
+# Startup timing marks (reported when MINESWEEPER_STARTUP_TIMING is set)
+_PROCESS_T0: float = time.perf_counter()  # Taken before the heavy flet import
+
 import flet as ft
 import random
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+
+_IMPORTS_DONE: float = time.perf_counter()  # All module-level imports finished
+
+
+def report_startup(stage: str, mark: Optional[float] = None):
+    """
+    Print a startup timing line (ms since the module started loading) for the
+    measurement harness. Does nothing unless MINESWEEPER_STARTUP_TIMING is set.
+    """
+    if not os.environ.get("MINESWEEPER_STARTUP_TIMING"):
+        return
+    if mark is None:
+        mark = time.perf_counter()  # Default to "now"
+    elapsed_ms = (mark - _PROCESS_T0) * 1000
+    print(f"[startup] {stage}: {elapsed_ms:.1f} ms", flush=True)
 
 
 def main(page: ft.Page):
     """
     Main function that sets up the Minesweeper game UI and logic.
     This is the entry point for the Flet application.
+
+    The window frame, menu and top panel are shown first; the grid and the
+    mines are built right after that first paint so the window appears quickly.
     """
+    report_startup("imports", _IMPORTS_DONE)
+
     # Set up the page properties
     page.title = "Minesweeper UI"  # Window title
     page.bgcolor = "#C0C0C0"  # Classic gray background (like old Windows Minesweeper)
@@ -235,8 +261,8 @@ def main(page: ft.Page):
         # Center the grid horizontally
         return ft.Row([grid], alignment=ft.MainAxisAlignment.CENTER)
 
-    # Create the default grid based on initial rows and cols
-    grid_container = ft.Container(content=create_grid(rows, cols))
+    # Empty placeholder for the grid - it is filled in after the first paint
+    grid_container = ft.Container()
 
     # Create container for the menu bar (positioned below the game)
     menubar_container = ft.Container(
@@ -642,11 +668,15 @@ def main(page: ft.Page):
     # Put inner container in outer container
     outer_container.content = inner_container
 
-    # Add the main layout to the page
+    # Add the main layout to the page (first paint: frame, menu and top panel)
     page.add(main_layout)
+    report_startup("first paint")
 
-    # Initialize mines in the grid
+    # Build the default grid and initialize mines now that the window is visible
+    grid_container.content = create_grid(rows, cols)
     place_mines(rows, cols)
+    page.update()
+    report_startup("interactive")
 
 
 # === APPLICATION ENTRY POINT ===